@@ -6,6 +6,5 @@ export declare class AIClient {
     analyzeImage(imageData: Buffer, userQuestion?: string): Promise<string>;
     private analyzeWithClaude;
     private createConcisePrompt;
-    private detectImageFormat;
 }
 //# sourceMappingURL=ai_client.d.ts.map
\ No newline at end of file
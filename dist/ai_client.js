@@ -5,6 +5,7 @@ var __importDefault = (this && this.__importDefault) || function (mod) {
 Object.defineProperty(exports, "__esModule", { value: true });
 exports.AIClient = void 0;
 const sdk_1 = __importDefault(require("@anthropic-ai/sdk"));
+const image_format_1 = require("./image_format");
 class AIClient {
     constructor(provider, apiKey) {
         this.apiKey = apiKey;
@@ -23,7 +24,7 @@ class AIClient {
             // Encode image as base64 for Claude Vision API
             const base64Image = imageData.toString('base64');
             // Detect image format for proper MIME type
-            const mimeType = this.detectImageFormat(imageData);
+            const mimeType = (0, image_format_1.detectImageFormat)(imageData);
             // Create the enhanced prompt
             const prompt = this.createConcisePrompt(userQuestion);
             const response = await this.client.messages.create({
@@ -82,27 +83,6 @@ If it's not code:
 - Be concise and to the point`;
         }
     }
-    detectImageFormat(imageData) {
-        if (imageData.length < 8) {
-            return 'image/png'; // Default fallback
-        }
-        // Check PNG signature
-        if (imageData.subarray(0, 8).equals(Buffer.from([0x89, 0x50, 0x4E, 0x47, 0x0D, 0x0A, 0x1A, 0x0A]))) {
-            return 'image/png';
-        }
-        // Check JPEG signature
-        if (imageData.subarray(0, 3).equals(Buffer.from([0xFF, 0xD8, 0xFF]))) {
-            return 'image/jpeg';
-        }
-        // Check WebP signature
-        if (imageData.length >= 12 &&
-            imageData.subarray(0, 4).equals(Buffer.from('RIFF')) &&
-            imageData.subarray(8, 12).equals(Buffer.from('WEBP'))) {
-            return 'image/webp';
-        }
-        // Default to PNG
-        return 'image/png';
-    }
 }
 exports.AIClient = AIClient;
 //# sourceMappingURL=ai_client.js.map
\ No newline at end of file
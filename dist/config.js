@@ -38,6 +38,9 @@ const fs = __importStar(require("fs/promises"));
 const path = __importStar(require("path"));
 const os = __importStar(require("os"));
 const toml = __importStar(require("toml"));
+// Config location is fixed for the lifetime of the process
+const CONFIG_DIR = path.join(os.homedir(), '.config', 'ai-screenshot-analyzer');
+const CONFIG_FILE = path.join(CONFIG_DIR, 'config.toml');
 class AppConfig {
     constructor(config = {}) {
         const screenshotsDir = config.screenshotsDir || path.join(os.homedir(), '.ai-screenshots');
@@ -49,26 +52,23 @@ class AppConfig {
         this.defaultProvider = config.defaultProvider || 'claude';
     }
     static async load() {
-        const configDir = path.join(os.homedir(), '.config', 'ai-screenshot-analyzer');
-        const configFile = path.join(configDir, 'config.toml');
         try {
-            // Check if config file exists
-            await fs.access(configFile);
-            // Read and parse config file
-            const configStr = await fs.readFile(configFile, 'utf8');
+            // Read and parse config file (rejects if it doesn't exist yet)
+            const configStr = await fs.readFile(CONFIG_FILE, 'utf8');
             const configData = toml.parse(configStr);
             return new AppConfig(configData);
         }
         catch (error) {
             // Config file doesn't exist, create default config
             const config = new AppConfig();
-            // Create config directory
-            await fs.mkdir(configDir, { recursive: true });
-            // Create screenshots directory
-            await fs.mkdir(config.screenshotsDir, { recursive: true });
+            // Create config and screenshots directories (independent, so in parallel)
+            await Promise.all([
+                fs.mkdir(CONFIG_DIR, { recursive: true }),
+                fs.mkdir(config.screenshotsDir, { recursive: true })
+            ]);
             // Save default config
             const configStr = this.toTomlString(config);
-            await fs.writeFile(configFile, configStr);
+            await fs.writeFile(CONFIG_FILE, configStr);
             return config;
         }
     }
@@ -86,11 +86,9 @@ default_provider = "${config.defaultProvider}"
 `;
     }
     async save() {
-        const configDir = path.join(os.homedir(), '.config', 'ai-screenshot-analyzer');
-        const configFile = path.join(configDir, 'config.toml');
-        await fs.mkdir(configDir, { recursive: true });
+        await fs.mkdir(CONFIG_DIR, { recursive: true });
         const configStr = AppConfig.toTomlString(this);
-        await fs.writeFile(configFile, configStr);
+        await fs.writeFile(CONFIG_FILE, configStr);
     }
 }
 exports.AppConfig = AppConfig;
@@ -4,6 +4,21 @@ exports.HotkeyMonitor = void 0;
 const node_global_key_listener_1 = require("node-global-key-listener");
 const events_1 = require("events");
 const ui_1 = require("./ui");
+// Platform never changes at runtime, so the hotkey is chosen once
+const IS_MAC = process.platform === 'darwin';
+const HOTKEY_LABEL = IS_MAC ? 'Cmd+Shift+Space' : 'Ctrl+Shift+Space';
+// Modifier keys accept either their LEFT or RIGHT variant
+const KEY_VARIANTS = {
+    'LEFT META': ['LEFT META', 'RIGHT META'],
+    'LEFT CTRL': ['LEFT CTRL', 'RIGHT CTRL'],
+    'LEFT SHIFT': ['LEFT SHIFT', 'RIGHT SHIFT']
+};
+function isKeyHeld(requiredKey, pressedKeys) {
+    const variants = KEY_VARIANTS[requiredKey];
+    return variants
+        ? variants.some(variant => pressedKeys.has(variant))
+        : pressedKeys.has(requiredKey);
+}
 class HotkeyMonitor extends events_1.EventEmitter {
     constructor() {
         super();
@@ -16,7 +31,7 @@ class HotkeyMonitor extends events_1.EventEmitter {
         this.keyTimeouts = new Map(); // Track key release timeouts
         this.keyReleaseDelay = 500; // How long to wait before considering a key "released"
         // Define required keys based on platform
-        this.requiredKeys = process.platform === 'darwin'
+        this.requiredKeys = IS_MAC
             ? ['LEFT META', 'LEFT SHIFT', 'SPACE'] // macOS: Cmd+Shift+Space
             : ['LEFT CTRL', 'LEFT SHIFT', 'SPACE']; // Windows/Linux: Ctrl+Shift+Space
     }
@@ -25,8 +40,7 @@ class HotkeyMonitor extends events_1.EventEmitter {
             console.warn('Hotkey monitoring is already running');
             return;
         }
-        const hotkeyStr = process.platform === 'darwin' ? 'Cmd+Shift+Space' : 'Ctrl+Shift+Space';
-        console.log(`🎹 Starting hotkey monitoring (${hotkeyStr})`);
+        console.log(`🎹 Starting hotkey monitoring (${HOTKEY_LABEL})`);
         console.log(`🔍 Detected platform: ${process.platform}`);
         console.log(`📋 Required keys: ${this.requiredKeys.join(', ')}`);
         try {
@@ -88,21 +102,7 @@ class HotkeyMonitor extends events_1.EventEmitter {
     }
     areAllKeysPressed() {
         // Check if ALL required keys are currently pressed
-        const allPressed = this.requiredKeys.every(requiredKey => {
-            // For modifier keys, accept either LEFT or RIGHT variants
-            if (requiredKey === 'LEFT META') {
-                return this.pressedKeys.has('LEFT META') || this.pressedKeys.has('RIGHT META');
-            }
-            else if (requiredKey === 'LEFT CTRL') {
-                return this.pressedKeys.has('LEFT CTRL') || this.pressedKeys.has('RIGHT CTRL');
-            }
-            else if (requiredKey === 'LEFT SHIFT') {
-                return this.pressedKeys.has('LEFT SHIFT') || this.pressedKeys.has('RIGHT SHIFT');
-            }
-            else {
-                return this.pressedKeys.has(requiredKey);
-            }
-        });
+        const allPressed = this.requiredKeys.every(requiredKey => isKeyHeld(requiredKey, this.pressedKeys));
         // Don't restrict extra keys - just ensure all required keys are pressed
         return allPressed;
     }
@@ -169,66 +169,43 @@ class HotkeyMonitor extends events_1.EventEmitter {
     }
     async testKeyDetection() {
         console.log('🧪 Testing key detection capabilities...');
-        const hotkey = process.platform === 'darwin' ? 'Cmd+Shift+Space' : 'Ctrl+Shift+Space';
-        console.log(`Expected hotkey: ${hotkey}`);
+        console.log(`Expected hotkey: ${HOTKEY_LABEL}`);
         console.log(`Required keys: ${this.requiredKeys.join(' + ')}`);
         console.log('Press individual keys to see detection...');
         console.log('Press the full hotkey combination to test complete detection');
         console.log('Press Ctrl+C to cancel test');
         try {
             const listener = new node_global_key_listener_1.GlobalKeyboardListener();
-            let testCompleted = false;
             const pressedTestKeys = new Set();
-            const timeout = setTimeout(() => {
-                if (!testCompleted) {
+            // Wait until the full hotkey is detected or the test times out
+            await new Promise(resolve => {
+                const timeout = setTimeout(() => {
                     console.log('❌ Test timed out - no complete hotkey detected within 30 seconds');
                     listener.kill();
-                    testCompleted = true;
-                }
-            }, 30000);
-            listener.addListener((e, down) => {
-                const keyName = e.name;
-                // Skip if key name is undefined
-                if (!keyName) {
-                    return;
-                }
-                if (down) {
-                    pressedTestKeys.add(keyName);
-                    // Check if all required keys are pressed
-                    const allRequired = this.requiredKeys.every(requiredKey => {
-                        if (requiredKey === 'LEFT META') {
-                            return pressedTestKeys.has('LEFT META') || pressedTestKeys.has('RIGHT META');
-                        }
-                        else if (requiredKey === 'LEFT CTRL') {
-                            return pressedTestKeys.has('LEFT CTRL') || pressedTestKeys.has('RIGHT CTRL');
-                        }
-                        else if (requiredKey === 'LEFT SHIFT') {
-                            return pressedTestKeys.has('LEFT SHIFT') || pressedTestKeys.has('RIGHT SHIFT');
-                        }
-                        else {
-                            return pressedTestKeys.has(requiredKey);
+                    resolve();
+                }, 30000);
+                listener.addListener((e, down) => {
+                    const keyName = e.name;
+                    // Skip if key name is undefined
+                    if (!keyName) {
+                        return;
+                    }
+                    if (down) {
+                        pressedTestKeys.add(keyName);
+                        // Check if all required keys are pressed
+                        const allRequired = this.requiredKeys.every(requiredKey => isKeyHeld(requiredKey, pressedTestKeys));
+                        if (allRequired) {
+                            console.log('🎉 SUCCESS: Complete hotkey combination detected!');
+                            console.log('✅ Hotkey detection is working correctly');
+                            clearTimeout(timeout);
+                            listener.kill();
+                            resolve();
                         }
-                    });
-                    if (allRequired) {
-                        console.log('🎉 SUCCESS: Complete hotkey combination detected!');
-                        console.log('✅ Hotkey detection is working correctly');
-                        testCompleted = true;
-                        clearTimeout(timeout);
-                        listener.kill();
                     }
-                }
-                else {
-                    pressedTestKeys.delete(keyName);
-                }
-            });
-            // Wait for test to complete
-            await new Promise(resolve => {
-                const checkInterval = setInterval(() => {
-                    if (testCompleted) {
-                        clearInterval(checkInterval);
-                        resolve();
+                    else {
+                        pressedTestKeys.delete(keyName);
                     }
-                }, 100);
+                });
             });
         }
         catch (error) {
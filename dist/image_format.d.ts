@@ -0,0 +1 @@
+export declare function detectImageFormat(imageData: Buffer): string;
\ No newline at end of file
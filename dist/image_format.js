@@ -0,0 +1,29 @@
+"use strict";
+Object.defineProperty(exports, "__esModule", { value: true });
+exports.detectImageFormat = detectImageFormat;
+// Magic numbers for image format detection
+const PNG_SIGNATURE = Buffer.from([0x89, 0x50, 0x4E, 0x47, 0x0D, 0x0A, 0x1A, 0x0A]);
+const JPEG_SIGNATURE = Buffer.from([0xFF, 0xD8, 0xFF]);
+const RIFF_SIGNATURE = Buffer.from('RIFF');
+const WEBP_SIGNATURE = Buffer.from('WEBP');
+function detectImageFormat(imageData) {
+    if (imageData.length < 8) {
+        return 'image/png'; // Default fallback
+    }
+    // Check PNG signature
+    if (imageData.subarray(0, 8).equals(PNG_SIGNATURE)) {
+        return 'image/png';
+    }
+    // Check JPEG signature
+    if (imageData.subarray(0, 3).equals(JPEG_SIGNATURE)) {
+        return 'image/jpeg';
+    }
+    // Check WebP signature
+    if (imageData.length >= 12 &&
+        imageData.subarray(0, 4).equals(RIFF_SIGNATURE) &&
+        imageData.subarray(8, 12).equals(WEBP_SIGNATURE)) {
+        return 'image/webp';
+    }
+    // Default to PNG
+    return 'image/png';
+}
\ No newline at end of file
@@ -1,5 +1,38 @@
 #!/usr/bin/env node
 "use strict";
+var __createBinding = (this && this.__createBinding) || (Object.create ? (function(o, m, k, k2) {
+    if (k2 === undefined) k2 = k;
+    var desc = Object.getOwnPropertyDescriptor(m, k);
+    if (!desc || ("get" in desc ? !m.__esModule : desc.writable || desc.configurable)) {
+      desc = { enumerable: true, get: function() { return m[k]; } };
+    }
+    Object.defineProperty(o, k2, desc);
+}) : (function(o, m, k, k2) {
+    if (k2 === undefined) k2 = k;
+    o[k2] = m[k];
+}));
+var __setModuleDefault = (this && this.__setModuleDefault) || (Object.create ? (function(o, v) {
+    Object.defineProperty(o, "default", { enumerable: true, value: v });
+}) : function(o, v) {
+    o["default"] = v;
+});
+var __importStar = (this && this.__importStar) || (function () {
+    var ownKeys = function(o) {
+        ownKeys = Object.getOwnPropertyNames || function (o) {
+            var ar = [];
+            for (var k in o) if (Object.prototype.hasOwnProperty.call(o, k)) ar[ar.length] = k;
+            return ar;
+        };
+        return ownKeys(o);
+    };
+    return function (mod) {
+        if (mod && mod.__esModule) return mod;
+        var result = {};
+        if (mod != null) for (var k = ownKeys(mod), i = 0; i < k.length; i++) if (k[i] !== "default") __createBinding(result, mod, k[i]);
+        __setModuleDefault(result, mod);
+        return result;
+    };
+})();
 Object.defineProperty(exports, "__esModule", { value: true });
 exports.main = main;
 require("dotenv/config");
@@ -7,7 +40,6 @@ const commander_1 = require("commander");
 const config_1 = require("./config");
 const ai_client_1 = require("./ai_client");
 const screenshot_1 = require("./screenshot");
-const hotkey_monitor_1 = require("./hotkey_monitor");
 const terminal_monitor_1 = require("./terminal_monitor");
 const ui_1 = require("./ui");
 async function main() {
@@ -130,7 +162,9 @@ async function runDaemon(state, options) {
         case 'hotkey':
             // Try hotkey mode (may fail due to permissions)
             try {
-                monitor = new hotkey_monitor_1.HotkeyMonitor();
+                // Loaded on demand: the global key listener is only needed in this mode
+                const { HotkeyMonitor } = await Promise.resolve().then(() => __importStar(require('./hotkey_monitor')));
+                monitor = new HotkeyMonitor();
                 await monitor.startMonitoring(state);
                 console.log('✅ Hotkey monitoring started successfully');
             }
@@ -178,28 +212,28 @@ async function showConfig(state) {
     console.log(`├── Max Image Size: ${state.config.maxImageSizeMb} MB`);
     console.log(`└── AI Provider: ${state.aiClient.provider()}`);
 }
+// Small PNG used to probe the AI connection, built once at module load
+const TEST_IMAGE = Buffer.from([
+    0x89, 0x50, 0x4E, 0x47, 0x0D, 0x0A, 0x1A, 0x0A, 0x00, 0x00, 0x00, 0x0D, 0x49, 0x48, 0x44, 0x52,
+    0x00, 0x00, 0x00, 0x20, 0x00, 0x00, 0x00, 0x20, 0x08, 0x06, 0x00, 0x00, 0x00, 0x73, 0x7A, 0x7A,
+    0xF4, 0x00, 0x00, 0x00, 0x95, 0x49, 0x44, 0x41, 0x54, 0x58, 0x85, 0xED, 0xD7, 0x31, 0x0E, 0x80,
+    0x20, 0x0C, 0x04, 0x50, 0xD7, 0xFF, 0xFF, 0x93, 0x3B, 0x05, 0x4A, 0x05, 0x52, 0x22, 0x05, 0x52,
+    0x22, 0x05, 0x52, 0x22, 0x05, 0x52, 0x22, 0x05, 0x52, 0x22, 0x05, 0x52, 0x22, 0x05, 0x52, 0x22,
+    0x05, 0x52, 0x22, 0x05, 0x52, 0x22, 0x05, 0x52, 0x22, 0x05, 0x52, 0x22, 0x05, 0x52, 0x22, 0x05,
+    0x52, 0x22, 0x05, 0x52, 0x22, 0x05, 0x52, 0x22, 0x05, 0x52, 0x22, 0x05, 0x52, 0x22, 0x05, 0x52,
+    0x22, 0x05, 0x52, 0x22, 0x05, 0x52, 0x22, 0x05, 0x52, 0x22, 0x05, 0x52, 0x22, 0x05, 0x52, 0x22,
+    0x05, 0x52, 0x22, 0x05, 0x52, 0x22, 0x05, 0x52, 0x22, 0x05, 0x52, 0x22, 0x05, 0x52, 0x22, 0x05,
+    0x52, 0x22, 0x05, 0x52, 0x22, 0x05, 0x52, 0x22, 0x05, 0x52, 0x22, 0x05, 0x52, 0x22, 0x05, 0x52,
+    0x22, 0x05, 0x52, 0x22, 0x05, 0x52, 0x22, 0x05, 0x52, 0x22, 0x05, 0x52, 0x22, 0x05, 0x52, 0x22,
+    0x05, 0x52, 0x22, 0x05, 0x52, 0x22, 0x05, 0x52, 0x22, 0x05, 0x52, 0x22, 0x05, 0x52, 0x22, 0x05,
+    0x52, 0x22, 0x05, 0x52, 0x22, 0x05, 0x52, 0x22, 0x05, 0x52, 0x22, 0x05, 0x52, 0x22, 0x05, 0x52,
+    0x22, 0x05, 0x52, 0x22, 0x05, 0x52, 0x22, 0x05, 0x52, 0x22, 0x05, 0x52, 0x22, 0x00, 0x00, 0x00,
+    0x00, 0x49, 0x45, 0x4E, 0x44, 0xAE, 0x42, 0x60, 0x82
+]);
 async function testAiConnection(state) {
     (0, ui_1.printStatus)('🧪 Testing AI connection...');
     try {
-        // Create a simple test image
-        const testImage = Buffer.from([
-            0x89, 0x50, 0x4E, 0x47, 0x0D, 0x0A, 0x1A, 0x0A, 0x00, 0x00, 0x00, 0x0D, 0x49, 0x48, 0x44, 0x52,
-            0x00, 0x00, 0x00, 0x20, 0x00, 0x00, 0x00, 0x20, 0x08, 0x06, 0x00, 0x00, 0x00, 0x73, 0x7A, 0x7A,
-            0xF4, 0x00, 0x00, 0x00, 0x95, 0x49, 0x44, 0x41, 0x54, 0x58, 0x85, 0xED, 0xD7, 0x31, 0x0E, 0x80,
-            0x20, 0x0C, 0x04, 0x50, 0xD7, 0xFF, 0xFF, 0x93, 0x3B, 0x05, 0x4A, 0x05, 0x52, 0x22, 0x05, 0x52,
-            0x22, 0x05, 0x52, 0x22, 0x05, 0x52, 0x22, 0x05, 0x52, 0x22, 0x05, 0x52, 0x22, 0x05, 0x52, 0x22,
-            0x05, 0x52, 0x22, 0x05, 0x52, 0x22, 0x05, 0x52, 0x22, 0x05, 0x52, 0x22, 0x05, 0x52, 0x22, 0x05,
-            0x52, 0x22, 0x05, 0x52, 0x22, 0x05, 0x52, 0x22, 0x05, 0x52, 0x22, 0x05, 0x52, 0x22, 0x05, 0x52,
-            0x22, 0x05, 0x52, 0x22, 0x05, 0x52, 0x22, 0x05, 0x52, 0x22, 0x05, 0x52, 0x22, 0x05, 0x52, 0x22,
-            0x05, 0x52, 0x22, 0x05, 0x52, 0x22, 0x05, 0x52, 0x22, 0x05, 0x52, 0x22, 0x05, 0x52, 0x22, 0x05,
-            0x52, 0x22, 0x05, 0x52, 0x22, 0x05, 0x52, 0x22, 0x05, 0x52, 0x22, 0x05, 0x52, 0x22, 0x05, 0x52,
-            0x22, 0x05, 0x52, 0x22, 0x05, 0x52, 0x22, 0x05, 0x52, 0x22, 0x05, 0x52, 0x22, 0x05, 0x52, 0x22,
-            0x05, 0x52, 0x22, 0x05, 0x52, 0x22, 0x05, 0x52, 0x22, 0x05, 0x52, 0x22, 0x05, 0x52, 0x22, 0x05,
-            0x52, 0x22, 0x05, 0x52, 0x22, 0x05, 0x52, 0x22, 0x05, 0x52, 0x22, 0x05, 0x52, 0x22, 0x05, 0x52,
-            0x22, 0x05, 0x52, 0x22, 0x05, 0x52, 0x22, 0x05, 0x52, 0x22, 0x05, 0x52, 0x22, 0x00, 0x00, 0x00,
-            0x00, 0x49, 0x45, 0x4E, 0x44, 0xAE, 0x42, 0x60, 0x82
-        ]);
-        await state.aiClient.analyzeImage(testImage, 'This is a test. Please respond with "Connection successful".');
+        await state.aiClient.analyzeImage(TEST_IMAGE, 'This is a test. Please respond with "Connection successful".');
         (0, ui_1.printSuccess)('✅ AI connection successful!');
     }
     catch (error) {
@@ -217,7 +251,8 @@ async function testHotkeyDetection() {
     console.log('🔍 Testing hotkey capability...');
     console.log(`   Platform: ${process.platform}`);
     try {
-        const monitor = new hotkey_monitor_1.HotkeyMonitor();
+        const { HotkeyMonitor } = await Promise.resolve().then(() => __importStar(require('./hotkey_monitor')));
+        const monitor = new HotkeyMonitor();
         await monitor.testKeyDetection();
     }
     catch (error) {
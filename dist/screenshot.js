@@ -1,11 +1,53 @@
 "use strict";
+var __createBinding = (this && this.__createBinding) || (Object.create ? (function(o, m, k, k2) {
+    if (k2 === undefined) k2 = k;
+    var desc = Object.getOwnPropertyDescriptor(m, k);
+    if (!desc || ("get" in desc ? !m.__esModule : desc.writable || desc.configurable)) {
+      desc = { enumerable: true, get: function() { return m[k]; } };
+    }
+    Object.defineProperty(o, k2, desc);
+}) : (function(o, m, k, k2) {
+    if (k2 === undefined) k2 = k;
+    o[k2] = m[k];
+}));
+var __setModuleDefault = (this && this.__setModuleDefault) || (Object.create ? (function(o, v) {
+    Object.defineProperty(o, "default", { enumerable: true, value: v });
+}) : function(o, v) {
+    o["default"] = v;
+});
+var __importStar = (this && this.__importStar) || (function () {
+    var ownKeys = function(o) {
+        ownKeys = Object.getOwnPropertyNames || function (o) {
+            var ar = [];
+            for (var k in o) if (Object.prototype.hasOwnProperty.call(o, k)) ar[ar.length] = k;
+            return ar;
+        };
+        return ownKeys(o);
+    };
+    return function (mod) {
+        if (mod && mod.__esModule) return mod;
+        var result = {};
+        if (mod != null) for (var k = ownKeys(mod), i = 0; i < k.length; i++) if (k[i] !== "default") __createBinding(result, mod, k[i]);
+        __setModuleDefault(result, mod);
+        return result;
+    };
+})();
 var __importDefault = (this && this.__importDefault) || function (mod) {
     return (mod && mod.__esModule) ? mod : { "default": mod };
 };
 Object.defineProperty(exports, "__esModule", { value: true });
 exports.ScreenshotCapture = void 0;
 const screenshot_desktop_1 = __importDefault(require("screenshot-desktop"));
-const sharp_1 = __importDefault(require("sharp"));
+const image_format_1 = require("./image_format");
+// sharp is a native module; load it on first use so commands that never
+// process an image (config, test-hotkey, --help) don't pay for it
+let sharpLoader = null;
+function loadSharp() {
+    if (!sharpLoader) {
+        sharpLoader = Promise.resolve().then(() => __importStar(require('sharp'))).then(mod => mod.default);
+    }
+    return sharpLoader;
+}
 class ScreenshotCapture {
     constructor() { }
     async capture() {
@@ -26,8 +68,9 @@ class ScreenshotCapture {
     }
     async optimizeImage(imageBuffer) {
         try {
+            const sharp = await loadSharp();
             // Get image metadata
-            const metadata = await (0, sharp_1.default)(imageBuffer).metadata();
+            const metadata = await sharp(imageBuffer).metadata();
             console.log(`Image metadata: ${metadata.width}x${metadata.height}, format: ${metadata.format}`);
             // Analyze image complexity to choose optimal format
             const complexity = await this.analyzeImageComplexity(imageBuffer);
@@ -36,7 +79,7 @@ class ScreenshotCapture {
             if (complexity < 0.3) {
                 // Low complexity - use PNG for better text preservation
                 console.log('Using PNG format for low complexity image');
-                optimizedBuffer = await (0, sharp_1.default)(imageBuffer)
+                optimizedBuffer = await sharp(imageBuffer)
                     .png({
                     compressionLevel: 9,
                     adaptiveFiltering: true
@@ -46,7 +89,7 @@ class ScreenshotCapture {
             else {
                 // High complexity - use high-quality JPEG
                 console.log('Using JPEG format for high complexity image');
-                optimizedBuffer = await (0, sharp_1.default)(imageBuffer)
+                optimizedBuffer = await sharp(imageBuffer)
                     .jpeg({
                     quality: 95,
                     progressive: true
@@ -59,7 +102,7 @@ class ScreenshotCapture {
             if (optimizedBuffer.length > maxSizeBytes) {
                 console.log('Image too large, applying additional compression...');
                 // Apply more aggressive compression
-                optimizedBuffer = await (0, sharp_1.default)(imageBuffer)
+                optimizedBuffer = await sharp(imageBuffer)
                     .jpeg({
                     quality: 85,
                     progressive: true
@@ -81,8 +124,9 @@ class ScreenshotCapture {
     }
     async analyzeImageComplexity(imageBuffer) {
         try {
+            const sharp = await loadSharp();
             // Convert to raw RGB data for analysis
-            const { data, info } = await (0, sharp_1.default)(imageBuffer)
+            const { data, info } = await sharp(imageBuffer)
                 .raw()
                 .toBuffer({ resolveWithObject: true });
             const { width, height, channels } = info;
@@ -118,25 +162,7 @@ class ScreenshotCapture {
         }
     }
     detectImageFormat(imageBuffer) {
-        if (imageBuffer.length < 8) {
-            return 'image/png'; // Default fallback
-        }
-        // Check PNG signature
-        if (imageBuffer.subarray(0, 8).equals(Buffer.from([0x89, 0x50, 0x4E, 0x47, 0x0D, 0x0A, 0x1A, 0x0A]))) {
-            return 'image/png';
-        }
-        // Check JPEG signature
-        if (imageBuffer.subarray(0, 3).equals(Buffer.from([0xFF, 0xD8, 0xFF]))) {
-            return 'image/jpeg';
-        }
-        // Check WebP signature
-        if (imageBuffer.length >= 12 &&
-            imageBuffer.subarray(0, 4).equals(Buffer.from('RIFF')) &&
-            imageBuffer.subarray(8, 12).equals(Buffer.from('WEBP'))) {
-            return 'image/webp';
-        }
-        // Default to PNG
-        return 'image/png';
+        return (0, image_format_1.detectImageFormat)(imageBuffer);
     }
 }
 exports.ScreenshotCapture = ScreenshotCapture;
@@ -32,15 +32,17 @@ function printAnalysisResult(analysis) {
     const lines = analysis.split('\n');
     let inCodeBlock = false;
     for (const line of lines) {
-        if (line.trim().startsWith('┌─ CODE SOLUTION')) {
+        // Trim once per line rather than once per check
+        const trimmed = line.trim();
+        if (trimmed.startsWith('┌─ CODE SOLUTION')) {
             // Code block header - make it bright and noticeable
             console.log(chalk_1.default.green(line));
         }
-        else if (line.trim().startsWith('└─')) {
+        else if (trimmed.startsWith('└─')) {
             // Code block footer
             console.log(chalk_1.default.green(line));
         }
-        else if (line.trim().startsWith('```')) {
+        else if (trimmed.startsWith('```')) {
             if (!inCodeBlock) {
                 // Starting code block
                 console.log(chalk_1.default.yellow(line));
@@ -56,7 +58,7 @@ function printAnalysisResult(analysis) {
             // Code content - bright white on black for visibility
             console.log(chalk_1.default.bgBlack.white(line));
         }
-        else if (line.trim().startsWith('─')) {
+        else if (trimmed.startsWith('─')) {
             // Separator lines
             console.log(chalk_1.default.blue(line));
         }
@@ -1,4 +1,5 @@
 import Anthropic from '@anthropic-ai/sdk';
+import { detectImageFormat } from './image_format';
 
 export class AIClient {
     private client: Anthropic;
@@ -25,7 +26,7 @@ export class AIClient {
             const base64Image = imageData.toString('base64');
 
             // Detect image format for proper MIME type
-            const mimeType = this.detectImageFormat(imageData);
+            const mimeType = detectImageFormat(imageData);
 
             // Create the enhanced prompt
             const prompt = this.createConcisePrompt(userQuestion);
@@ -87,30 +88,4 @@ If it's not code:
 - Be concise and to the point`;
         }
     }
-
-    private detectImageFormat(imageData: Buffer): string {
-        if (imageData.length < 8) {
-            return 'image/png'; // Default fallback
-        }
-
-        // Check PNG signature
-        if (imageData.subarray(0, 8).equals(Buffer.from([0x89, 0x50, 0x4E, 0x47, 0x0D, 0x0A, 0x1A, 0x0A]))) {
-            return 'image/png';
-        }
-
-        // Check JPEG signature
-        if (imageData.subarray(0, 3).equals(Buffer.from([0xFF, 0xD8, 0xFF]))) {
-            return 'image/jpeg';
-        }
-
-        // Check WebP signature
-        if (imageData.length >= 12 &&
-            imageData.subarray(0, 4).equals(Buffer.from('RIFF')) &&
-            imageData.subarray(8, 12).equals(Buffer.from('WEBP'))) {
-            return 'image/webp';
-        }
-
-        // Default to PNG
-        return 'image/png';
-    }
 }
\ No newline at end of file
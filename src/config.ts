@@ -3,6 +3,10 @@ import * as path from 'path';
 import * as os from 'os';
 import * as toml from 'toml';
 
+// Config location is fixed for the lifetime of the process
+const CONFIG_DIR = path.join(os.homedir(), '.config', 'ai-screenshot-analyzer');
+const CONFIG_FILE = path.join(CONFIG_DIR, 'config.toml');
+
 export interface AppConfig {
     screenshotsDir: string;
     imageFormat: string;
@@ -32,15 +36,9 @@ export class AppConfig {
     }
 
     static async load(): Promise<AppConfig> {
-        const configDir = path.join(os.homedir(), '.config', 'ai-screenshot-analyzer');
-        const configFile = path.join(configDir, 'config.toml');
-
         try {
-            // Check if config file exists
-            await fs.access(configFile);
-            
-            // Read and parse config file
-            const configStr = await fs.readFile(configFile, 'utf8');
+            // Read and parse config file (rejects if it doesn't exist yet)
+            const configStr = await fs.readFile(CONFIG_FILE, 'utf8');
             const configData = toml.parse(configStr);
             
             return new AppConfig(configData);
@@ -48,15 +46,15 @@ export class AppConfig {
             // Config file doesn't exist, create default config
             const config = new AppConfig();
             
-            // Create config directory
-            await fs.mkdir(configDir, { recursive: true });
-            
-            // Create screenshots directory
-            await fs.mkdir(config.screenshotsDir, { recursive: true });
+            // Create config and screenshots directories (independent, so in parallel)
+            await Promise.all([
+                fs.mkdir(CONFIG_DIR, { recursive: true }),
+                fs.mkdir(config.screenshotsDir, { recursive: true })
+            ]);
             
             // Save default config
             const configStr = this.toTomlString(config);
-            await fs.writeFile(configFile, configStr);
+            await fs.writeFile(CONFIG_FILE, configStr);
             
             return config;
         }
@@ -77,12 +75,9 @@ default_provider = "${config.defaultProvider}"
     }
 
     async save(): Promise<void> {
-        const configDir = path.join(os.homedir(), '.config', 'ai-screenshot-analyzer');
-        const configFile = path.join(configDir, 'config.toml');
-        
-        await fs.mkdir(configDir, { recursive: true });
+        await fs.mkdir(CONFIG_DIR, { recursive: true });
         
         const configStr = AppConfig.toTomlString(this);
-        await fs.writeFile(configFile, configStr);
+        await fs.writeFile(CONFIG_FILE, configStr);
     }
 }
\ No newline at end of file
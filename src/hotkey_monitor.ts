@@ -3,6 +3,24 @@ import { EventEmitter } from 'events';
 import { AppState } from './main';
 import { printStatus, printAnalysisResult } from './ui';
 
+// Platform never changes at runtime, so the hotkey is chosen once
+const IS_MAC = process.platform === 'darwin';
+const HOTKEY_LABEL = IS_MAC ? 'Cmd+Shift+Space' : 'Ctrl+Shift+Space';
+
+// Modifier keys accept either their LEFT or RIGHT variant
+const KEY_VARIANTS: Record<string, string[]> = {
+    'LEFT META': ['LEFT META', 'RIGHT META'],
+    'LEFT CTRL': ['LEFT CTRL', 'RIGHT CTRL'],
+    'LEFT SHIFT': ['LEFT SHIFT', 'RIGHT SHIFT']
+};
+
+function isKeyHeld(requiredKey: string, pressedKeys: Set<string>): boolean {
+    const variants = KEY_VARIANTS[requiredKey];
+    return variants
+        ? variants.some(variant => pressedKeys.has(variant))
+        : pressedKeys.has(requiredKey);
+}
+
 export class HotkeyMonitor extends EventEmitter {
     private keyboardListener: GlobalKeyboardListener | null = null;
     private isRunning: boolean = false;
@@ -17,7 +35,7 @@ export class HotkeyMonitor extends EventEmitter {
     constructor() {
         super();
         // Define required keys based on platform
-        this.requiredKeys = process.platform === 'darwin' 
+        this.requiredKeys = IS_MAC
             ? ['LEFT META', 'LEFT SHIFT', 'SPACE']  // macOS: Cmd+Shift+Space
             : ['LEFT CTRL', 'LEFT SHIFT', 'SPACE']; // Windows/Linux: Ctrl+Shift+Space
     }
@@ -28,8 +46,7 @@ export class HotkeyMonitor extends EventEmitter {
             return;
         }
 
-        const hotkeyStr = process.platform === 'darwin' ? 'Cmd+Shift+Space' : 'Ctrl+Shift+Space';
-        console.log(`🎹 Starting hotkey monitoring (${hotkeyStr})`);
+        console.log(`🎹 Starting hotkey monitoring (${HOTKEY_LABEL})`);
         console.log(`🔍 Detected platform: ${process.platform}`);
         console.log(`📋 Required keys: ${this.requiredKeys.join(', ')}`);
 
@@ -102,18 +119,7 @@ export class HotkeyMonitor extends EventEmitter {
 
     private areAllKeysPressed(): boolean {
         // Check if ALL required keys are currently pressed
-        const allPressed = this.requiredKeys.every(requiredKey => {
-            // For modifier keys, accept either LEFT or RIGHT variants
-            if (requiredKey === 'LEFT META') {
-                return this.pressedKeys.has('LEFT META') || this.pressedKeys.has('RIGHT META');
-            } else if (requiredKey === 'LEFT CTRL') {
-                return this.pressedKeys.has('LEFT CTRL') || this.pressedKeys.has('RIGHT CTRL');
-            } else if (requiredKey === 'LEFT SHIFT') {
-                return this.pressedKeys.has('LEFT SHIFT') || this.pressedKeys.has('RIGHT SHIFT');
-            } else {
-                return this.pressedKeys.has(requiredKey);
-            }
-        });
+        const allPressed = this.requiredKeys.every(requiredKey => isKeyHeld(requiredKey, this.pressedKeys));
 
         // Don't restrict extra keys - just ensure all required keys are pressed
         return allPressed;
@@ -198,9 +204,7 @@ export class HotkeyMonitor extends EventEmitter {
     async testKeyDetection(): Promise<void> {
         console.log('🧪 Testing key detection capabilities...');
         
-        const hotkey = process.platform === 'darwin' ? 'Cmd+Shift+Space' : 'Ctrl+Shift+Space';
-        
-        console.log(`Expected hotkey: ${hotkey}`);
+        console.log(`Expected hotkey: ${HOTKEY_LABEL}`);
         console.log(`Required keys: ${this.requiredKeys.join(' + ')}`);
         console.log('Press individual keys to see detection...');
         console.log('Press the full hotkey combination to test complete detection');
@@ -208,63 +212,42 @@ export class HotkeyMonitor extends EventEmitter {
         
         try {
             const listener = new GlobalKeyboardListener();
-            let testCompleted = false;
             const pressedTestKeys = new Set<string>();
             
-            const timeout = setTimeout(() => {
-                if (!testCompleted) {
+            // Wait until the full hotkey is detected or the test times out
+            await new Promise<void>(resolve => {
+                const timeout = setTimeout(() => {
                     console.log('❌ Test timed out - no complete hotkey detected within 30 seconds');
                     listener.kill();
-                    testCompleted = true;
-                }
-            }, 30000);
-
-            listener.addListener((e, down) => {
-                const keyName = e.name;
-                
-                // Skip if key name is undefined
-                if (!keyName) {
-                    return;
-                }
+                    resolve();
+                }, 30000);
 
-                if (down) {
-                    pressedTestKeys.add(keyName);
+                listener.addListener((e, down) => {
+                    const keyName = e.name;
                     
-                    // Check if all required keys are pressed
-                    const allRequired = this.requiredKeys.every(requiredKey => {
-                        if (requiredKey === 'LEFT META') {
-                            return pressedTestKeys.has('LEFT META') || pressedTestKeys.has('RIGHT META');
-                        } else if (requiredKey === 'LEFT CTRL') {
-                            return pressedTestKeys.has('LEFT CTRL') || pressedTestKeys.has('RIGHT CTRL');
-                        } else if (requiredKey === 'LEFT SHIFT') {
-                            return pressedTestKeys.has('LEFT SHIFT') || pressedTestKeys.has('RIGHT SHIFT');
-                        } else {
-                            return pressedTestKeys.has(requiredKey);
-                        }
-                    });
-
-                    if (allRequired) {
-                        console.log('🎉 SUCCESS: Complete hotkey combination detected!');
-                        console.log('✅ Hotkey detection is working correctly');
-                        testCompleted = true;
-                        clearTimeout(timeout);
-                        listener.kill();
+                    // Skip if key name is undefined
+                    if (!keyName) {
+                        return;
                     }
-                } else {
-                    pressedTestKeys.delete(keyName);
-                }
-            });
-            
-            // Wait for test to complete
-            await new Promise<void>(resolve => {
-                const checkInterval = setInterval(() => {
-                    if (testCompleted) {
-                        clearInterval(checkInterval);
-                        resolve();
+
+                    if (down) {
+                        pressedTestKeys.add(keyName);
+                        
+                        // Check if all required keys are pressed
+                        const allRequired = this.requiredKeys.every(requiredKey => isKeyHeld(requiredKey, pressedTestKeys));
+
+                        if (allRequired) {
+                            console.log('🎉 SUCCESS: Complete hotkey combination detected!');
+                            console.log('✅ Hotkey detection is working correctly');
+                            clearTimeout(timeout);
+                            listener.kill();
+                            resolve();
+                        }
+                    } else {
+                        pressedTestKeys.delete(keyName);
                     }
-                }, 100);
+                });
             });
-            
         } catch (error) {
             console.error('❌ Key detection test failed:', error);
             throw error;
@@ -5,7 +5,6 @@ import { Command } from 'commander';
 import { AppConfig } from './config';
 import { AIClient } from './ai_client';
 import { ScreenshotCapture } from './screenshot';
-import { HotkeyMonitor } from './hotkey_monitor';
 import { TerminalMonitor, TimerMonitor } from './terminal_monitor';
 import { printHeader, printStatus, printSuccess, printError, printAnalysisResult } from './ui';
 
@@ -159,6 +158,8 @@ async function runDaemon(state: AppState, options: any): Promise<void> {
         case 'hotkey':
             // Try hotkey mode (may fail due to permissions)
             try {
+                // Loaded on demand: the global key listener is only needed in this mode
+                const { HotkeyMonitor } = await import('./hotkey_monitor');
                 monitor = new HotkeyMonitor();
                 await monitor.startMonitoring(state);
                 console.log('✅ Hotkey monitoring started successfully');
@@ -219,30 +220,30 @@ async function showConfig(state: AppState): Promise<void> {
     console.log(`└── AI Provider: ${state.aiClient.provider()}`);
 }
 
+// Small PNG used to probe the AI connection, built once at module load
+const TEST_IMAGE = Buffer.from([
+    0x89, 0x50, 0x4E, 0x47, 0x0D, 0x0A, 0x1A, 0x0A, 0x00, 0x00, 0x00, 0x0D, 0x49, 0x48, 0x44, 0x52,
+    0x00, 0x00, 0x00, 0x20, 0x00, 0x00, 0x00, 0x20, 0x08, 0x06, 0x00, 0x00, 0x00, 0x73, 0x7A, 0x7A,
+    0xF4, 0x00, 0x00, 0x00, 0x95, 0x49, 0x44, 0x41, 0x54, 0x58, 0x85, 0xED, 0xD7, 0x31, 0x0E, 0x80,
+    0x20, 0x0C, 0x04, 0x50, 0xD7, 0xFF, 0xFF, 0x93, 0x3B, 0x05, 0x4A, 0x05, 0x52, 0x22, 0x05, 0x52,
+    0x22, 0x05, 0x52, 0x22, 0x05, 0x52, 0x22, 0x05, 0x52, 0x22, 0x05, 0x52, 0x22, 0x05, 0x52, 0x22,
+    0x05, 0x52, 0x22, 0x05, 0x52, 0x22, 0x05, 0x52, 0x22, 0x05, 0x52, 0x22, 0x05, 0x52, 0x22, 0x05,
+    0x52, 0x22, 0x05, 0x52, 0x22, 0x05, 0x52, 0x22, 0x05, 0x52, 0x22, 0x05, 0x52, 0x22, 0x05, 0x52,
+    0x22, 0x05, 0x52, 0x22, 0x05, 0x52, 0x22, 0x05, 0x52, 0x22, 0x05, 0x52, 0x22, 0x05, 0x52, 0x22,
+    0x05, 0x52, 0x22, 0x05, 0x52, 0x22, 0x05, 0x52, 0x22, 0x05, 0x52, 0x22, 0x05, 0x52, 0x22, 0x05,
+    0x52, 0x22, 0x05, 0x52, 0x22, 0x05, 0x52, 0x22, 0x05, 0x52, 0x22, 0x05, 0x52, 0x22, 0x05, 0x52,
+    0x22, 0x05, 0x52, 0x22, 0x05, 0x52, 0x22, 0x05, 0x52, 0x22, 0x05, 0x52, 0x22, 0x05, 0x52, 0x22,
+    0x05, 0x52, 0x22, 0x05, 0x52, 0x22, 0x05, 0x52, 0x22, 0x05, 0x52, 0x22, 0x05, 0x52, 0x22, 0x05,
+    0x52, 0x22, 0x05, 0x52, 0x22, 0x05, 0x52, 0x22, 0x05, 0x52, 0x22, 0x05, 0x52, 0x22, 0x05, 0x52,
+    0x22, 0x05, 0x52, 0x22, 0x05, 0x52, 0x22, 0x05, 0x52, 0x22, 0x05, 0x52, 0x22, 0x00, 0x00, 0x00,
+    0x00, 0x49, 0x45, 0x4E, 0x44, 0xAE, 0x42, 0x60, 0x82
+]);
+
 async function testAiConnection(state: AppState): Promise<void> {
     printStatus('🧪 Testing AI connection...');
     
     try {
-        // Create a simple test image
-        const testImage = Buffer.from([
-            0x89, 0x50, 0x4E, 0x47, 0x0D, 0x0A, 0x1A, 0x0A, 0x00, 0x00, 0x00, 0x0D, 0x49, 0x48, 0x44, 0x52,
-            0x00, 0x00, 0x00, 0x20, 0x00, 0x00, 0x00, 0x20, 0x08, 0x06, 0x00, 0x00, 0x00, 0x73, 0x7A, 0x7A,
-            0xF4, 0x00, 0x00, 0x00, 0x95, 0x49, 0x44, 0x41, 0x54, 0x58, 0x85, 0xED, 0xD7, 0x31, 0x0E, 0x80,
-            0x20, 0x0C, 0x04, 0x50, 0xD7, 0xFF, 0xFF, 0x93, 0x3B, 0x05, 0x4A, 0x05, 0x52, 0x22, 0x05, 0x52,
-            0x22, 0x05, 0x52, 0x22, 0x05, 0x52, 0x22, 0x05, 0x52, 0x22, 0x05, 0x52, 0x22, 0x05, 0x52, 0x22,
-            0x05, 0x52, 0x22, 0x05, 0x52, 0x22, 0x05, 0x52, 0x22, 0x05, 0x52, 0x22, 0x05, 0x52, 0x22, 0x05,
-            0x52, 0x22, 0x05, 0x52, 0x22, 0x05, 0x52, 0x22, 0x05, 0x52, 0x22, 0x05, 0x52, 0x22, 0x05, 0x52,
-            0x22, 0x05, 0x52, 0x22, 0x05, 0x52, 0x22, 0x05, 0x52, 0x22, 0x05, 0x52, 0x22, 0x05, 0x52, 0x22,
-            0x05, 0x52, 0x22, 0x05, 0x52, 0x22, 0x05, 0x52, 0x22, 0x05, 0x52, 0x22, 0x05, 0x52, 0x22, 0x05,
-            0x52, 0x22, 0x05, 0x52, 0x22, 0x05, 0x52, 0x22, 0x05, 0x52, 0x22, 0x05, 0x52, 0x22, 0x05, 0x52,
-            0x22, 0x05, 0x52, 0x22, 0x05, 0x52, 0x22, 0x05, 0x52, 0x22, 0x05, 0x52, 0x22, 0x05, 0x52, 0x22,
-            0x05, 0x52, 0x22, 0x05, 0x52, 0x22, 0x05, 0x52, 0x22, 0x05, 0x52, 0x22, 0x05, 0x52, 0x22, 0x05,
-            0x52, 0x22, 0x05, 0x52, 0x22, 0x05, 0x52, 0x22, 0x05, 0x52, 0x22, 0x05, 0x52, 0x22, 0x05, 0x52,
-            0x22, 0x05, 0x52, 0x22, 0x05, 0x52, 0x22, 0x05, 0x52, 0x22, 0x05, 0x52, 0x22, 0x00, 0x00, 0x00,
-            0x00, 0x49, 0x45, 0x4E, 0x44, 0xAE, 0x42, 0x60, 0x82
-        ]);
-        
-        await state.aiClient.analyzeImage(testImage, 'This is a test. Please respond with "Connection successful".');
+        await state.aiClient.analyzeImage(TEST_IMAGE, 'This is a test. Please respond with "Connection successful".');
         printSuccess('✅ AI connection successful!');
     } catch (error) {
         printError(`❌ AI connection failed: ${error}`);
@@ -264,6 +265,7 @@ async function testHotkeyDetection(): Promise<void> {
     console.log(`   Platform: ${process.platform}`);
     
     try {
+        const { HotkeyMonitor } = await import('./hotkey_monitor');
         const monitor = new HotkeyMonitor();
         await monitor.testKeyDetection();
     } catch (error) {
@@ -1,5 +1,17 @@
 import screenshot from 'screenshot-desktop';
-import sharp from 'sharp';
+import type Sharp from 'sharp';
+import { detectImageFormat } from './image_format';
+
+// sharp is a native module; load it on first use so commands that never
+// process an image (config, test-hotkey, --help) don't pay for it
+let sharpLoader: Promise<typeof Sharp> | null = null;
+
+function loadSharp(): Promise<typeof Sharp> {
+    if (!sharpLoader) {
+        sharpLoader = import('sharp').then(mod => mod.default);
+    }
+    return sharpLoader;
+}
 
 export class ScreenshotCapture {
     constructor() {}
@@ -26,6 +38,8 @@ export class ScreenshotCapture {
 
     private async optimizeImage(imageBuffer: Buffer): Promise<Buffer> {
         try {
+            const sharp = await loadSharp();
+            
             // Get image metadata
             const metadata = await sharp(imageBuffer).metadata();
             console.log(`Image metadata: ${metadata.width}x${metadata.height}, format: ${metadata.format}`);
@@ -88,6 +102,8 @@ export class ScreenshotCapture {
 
     private async analyzeImageComplexity(imageBuffer: Buffer): Promise<number> {
         try {
+            const sharp = await loadSharp();
+            
             // Convert to raw RGB data for analysis
             const { data, info } = await sharp(imageBuffer)
                 .raw()
@@ -132,28 +148,6 @@ export class ScreenshotCapture {
     }
 
     detectImageFormat(imageBuffer: Buffer): string {
-        if (imageBuffer.length < 8) {
-            return 'image/png'; // Default fallback
-        }
-
-        // Check PNG signature
-        if (imageBuffer.subarray(0, 8).equals(Buffer.from([0x89, 0x50, 0x4E, 0x47, 0x0D, 0x0A, 0x1A, 0x0A]))) {
-            return 'image/png';
-        }
-
-        // Check JPEG signature
-        if (imageBuffer.subarray(0, 3).equals(Buffer.from([0xFF, 0xD8, 0xFF]))) {
-            return 'image/jpeg';
-        }
-
-        // Check WebP signature
-        if (imageBuffer.length >= 12 &&
-            imageBuffer.subarray(0, 4).equals(Buffer.from('RIFF')) &&
-            imageBuffer.subarray(8, 12).equals(Buffer.from('WEBP'))) {
-            return 'image/webp';
-        }
-
-        // Default to PNG
-        return 'image/png';
+        return detectImageFormat(imageBuffer);
     }
 }
\ No newline at end of file
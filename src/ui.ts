@@ -25,13 +25,16 @@ export function printAnalysisResult(analysis: string): void {
     let inCodeBlock = false;
     
     for (const line of lines) {
-        if (line.trim().startsWith('┌─ CODE SOLUTION')) {
+        // Trim once per line rather than once per check
+        const trimmed = line.trim();
+        
+        if (trimmed.startsWith('┌─ CODE SOLUTION')) {
             // Code block header - make it bright and noticeable
             console.log(chalk.green(line));
-        } else if (line.trim().startsWith('└─')) {
+        } else if (trimmed.startsWith('└─')) {
             // Code block footer
             console.log(chalk.green(line));
-        } else if (line.trim().startsWith('```')) {
+        } else if (trimmed.startsWith('```')) {
             if (!inCodeBlock) {
                 // Starting code block
                 console.log(chalk.yellow(line));
@@ -44,7 +47,7 @@ export function printAnalysisResult(analysis: string): void {
         } else if (inCodeBlock) {
             // Code content - bright white on black for visibility
             console.log(chalk.bgBlack.white(line));
-        } else if (line.trim().startsWith('─')) {
+        } else if (trimmed.startsWith('─')) {
             // Separator lines
             console.log(chalk.blue(line));
         } else if (line.includes('🤖 ChatGPT Analysis')) {
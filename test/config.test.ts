@@ -1,30 +1,6 @@
 import { AppConfig } from '../src/config';
-import * as fs from 'fs/promises';
-import * as path from 'path';
-import * as os from 'os';
 
 describe('AppConfig', () => {
-  const testConfigDir = path.join(os.tmpdir(), 'ai-screenshot-analyzer-test');
-  const testConfigFile = path.join(testConfigDir, 'config.toml');
-
-  beforeEach(async () => {
-    // Clean up test directory
-    try {
-      await fs.rm(testConfigDir, { recursive: true, force: true });
-    } catch (error) {
-      // Directory might not exist
-    }
-  });
-
-  afterEach(async () => {
-    // Clean up test directory
-    try {
-      await fs.rm(testConfigDir, { recursive: true, force: true });
-    } catch (error) {
-      // Directory might not exist
-    }
-  });
-
   test('should create default config', () => {
     const config = new AppConfig();
     
@@ -1,17 +1,109 @@
-import { exec } from 'child_process';
+import { execFile, spawn } from 'child_process';
 import { promisify } from 'util';
 import * as path from 'path';
 
-const execAsync = promisify(exec);
+const execFileAsync = promisify(execFile);
+
+const projectRoot = path.join(__dirname, '..');
+
+// Run the TypeScript build quietly; output is only kept for the failure message
+function runBuild(): Promise<void> {
+    return new Promise((resolve, reject) => {
+        const child = spawn('npm', ['run', 'build', '--silent'], {
+            cwd: projectRoot,
+            stdio: ['ignore', 'pipe', 'pipe'],
+            shell: process.platform === 'win32'
+        });
+        // tsc reports diagnostics on stdout, so both streams are collected
+        let output = '';
+        child.stdout!.on('data', (chunk) => {
+            output += chunk;
+        });
+        child.stderr!.on('data', (chunk) => {
+            output += chunk;
+        });
+        child.on('error', reject);
+        child.on('close', (code) => {
+            if (code === 0) {
+                resolve();
+            } else {
+                reject(new Error(`npm run build exited with code ${code}\n${output}`));
+            }
+        });
+    });
+}
+
+// Screen capture needs a window server; headless Linux runners have none
+const hasDisplay = process.platform !== 'linux' ||
+    Boolean(process.env.DISPLAY || process.env.WAYLAND_DISPLAY);
+const displayTest = hasDisplay ? test : test.skip;
 
 describe('Integration Tests', () => {
     const binaryPath = path.join(__dirname, '../dist/main.js');
     const timeout = 10000;
 
+    // Run the built CLI with the current node binary directly, without a shell
+    const runCli = (args: string[], options: { timeout?: number; env?: NodeJS.ProcessEnv } = {}) =>
+        execFileAsync(process.execPath, [binaryPath, ...args], { encoding: 'utf8', ...options });
+
+    // Run the CLI until marker appears on stdout (or it exits / the deadline
+    // passes), then stop it. test-hotkey waits up to 30s for real keypresses,
+    // so it has to be ended once its setup output has been printed.
+    const runCliUntil = (args: string[], marker: string, deadlineMs: number = 8000) =>
+        new Promise<string>((resolve, reject) => {
+            // On POSIX the CLI leads its own process group, so the key-server
+            // helper started by GlobalKeyboardListener is stopped along with it
+            const useProcessGroup = process.platform !== 'win32';
+            const child = spawn(process.execPath, [binaryPath, ...args], {
+                stdio: ['ignore', 'pipe', 'pipe'],
+                detached: useProcessGroup
+            });
+            let stdout = '';
+            let settled = false;
+            const stop = () => {
+                try {
+                    if (useProcessGroup && child.pid) {
+                        process.kill(-child.pid, 'SIGTERM');
+                    } else {
+                        child.kill();
+                    }
+                } catch (error) {
+                    // Group already gone
+                }
+            };
+            const finish = () => {
+                if (!settled) {
+                    settled = true;
+                    clearTimeout(deadline);
+                    stop();
+                    resolve(stdout);
+                }
+            };
+            const deadline = setTimeout(finish, deadlineMs);
+            child.stdout!.setEncoding('utf8');
+            child.stdout!.on('data', (chunk: string) => {
+                stdout += chunk;
+                if (stdout.includes(marker)) {
+                    finish();
+                }
+            });
+            child.on('error', (error) => {
+                if (!settled) {
+                    settled = true;
+                    clearTimeout(deadline);
+                    reject(error);
+                }
+            });
+            child.on('close', finish);
+        });
+
+    const expectedHotkey = process.platform === 'darwin' ? 'Cmd+Shift+Space' : 'Ctrl+Shift+Space';
+
     beforeAll(async () => {
-        // Ensure the binary is built
+        // Ensure the binary is built; tsc --incremental makes this a no-op when
+        // nothing has changed since the last build
         try {
-            await execAsync('npm run build');
+            await runBuild();
         } catch (error) {
             console.error('Build failed:', error);
         }
@@ -19,7 +111,7 @@ describe('Integration Tests', () => {
 
     describe('CLI Commands', () => {
         test('should show help message', async () => {
-            const { stdout } = await execAsync(`node ${binaryPath} --help`);
+            const { stdout } = await runCli(['--help']);
             expect(stdout).toContain('AI Screenshot Analyzer - Node.js/TypeScript version');
             expect(stdout).toContain('Commands:');
             expect(stdout).toContain('run');
@@ -31,12 +123,12 @@ describe('Integration Tests', () => {
         }, timeout);
 
         test('should show version', async () => {
-            const { stdout } = await execAsync(`node ${binaryPath} --version`);
+            const { stdout } = await runCli(['--version']);
             expect(stdout.trim()).toBe('0.1.0');
         }, timeout);
 
         test('should show configuration', async () => {
-            const { stdout } = await execAsync(`node ${binaryPath} config`);
+            const { stdout } = await runCli(['config']);
             expect(stdout).toContain('📋 Configuration:');
             expect(stdout).toContain('Screenshots Directory:');
             expect(stdout).toContain('Image Format:');
@@ -46,18 +138,18 @@ describe('Integration Tests', () => {
         }, timeout);
 
         test('should test hotkey detection', async () => {
-            const { stdout } = await execAsync(`node ${binaryPath} test-hotkey`);
-            expect(stdout).toContain('🧪 Hotkey Detection Test');
-            expect(stdout).toContain('Platform: darwin');
-            expect(stdout).toContain('Testing hotkey library...');
-            expect(stdout).toContain('Robot.js is functional for screenshot capture');
+            const stdout = await runCliUntil(['test-hotkey'], 'Press Ctrl+C to cancel test');
+            expect(stdout).toContain('📋 Testing input methods...');
+            expect(stdout).toContain('✅ Terminal input: Available');
+            expect(stdout).toContain('🔍 Testing hotkey capability...');
+            expect(stdout).toContain('🧪 Testing key detection capabilities...');
         }, timeout);
     });
 
     describe('Screenshot Functionality', () => {
-        test('should be able to capture screenshot', async () => {
+        displayTest('should be able to capture screenshot', async () => {
             try {
-                const { stdout } = await execAsync(`node ${binaryPath} capture`, { timeout: 30000 });
+                const { stdout } = await runCli(['capture'], { timeout: 30000 });
                 expect(stdout).toContain('📸 Capturing screenshot...');
                 expect(stdout).toContain('🤖 Analyzing with AI...');
                 expect(stdout).toContain('Claude Analysis');
@@ -71,7 +163,9 @@ describe('Integration Tests', () => {
     describe('Error Handling', () => {
         test('should handle invalid API key gracefully', async () => {
             try {
-                const { stdout, stderr } = await execAsync(`AI_API_KEY=invalid_key node ${binaryPath} test`);
+                const { stdout, stderr } = await runCli(['test'], {
+                    env: { ...process.env, AI_API_KEY: 'invalid_key' }
+                });
                 expect(stdout || stderr).toContain('AI connection failed');
             } catch (error) {
                 // This is expected behavior - the error message should contain API key error
@@ -82,9 +176,9 @@ describe('Integration Tests', () => {
 
     describe('Platform Compatibility', () => {
         test('should detect correct platform', async () => {
-            const { stdout } = await execAsync(`node ${binaryPath} test-hotkey`);
-            expect(stdout).toContain('Platform: darwin');
-            expect(stdout).toContain('Expected hotkey: Cmd+Shift+Space');
+            const stdout = await runCliUntil(['test-hotkey'], 'Press Ctrl+C to cancel test');
+            expect(stdout).toContain(`Platform: ${process.platform}`);
+            expect(stdout).toContain(`Expected hotkey: ${expectedHotkey}`);
         }, timeout);
     });
 });
\ No newline at end of file
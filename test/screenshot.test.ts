@@ -0,0 +1,42 @@
+import sharp from 'sharp';
+import { ScreenshotCapture } from '../src/screenshot';
+
+const WIDTH = 320;
+const HEIGHT = 200;
+const BACKGROUND = [238, 238, 238]; // flat light grey, like an editor or web page
+const DETAIL = [0, 102, 204];       // link-blue text/UI pixels
+
+// A flat grey screen with roughly `perMille` of its pixels replaced by blue
+// detail, scattered by a fixed-seed LCG so the fixture is identical every run
+async function sparseDetailScreenshot(perMille: number): Promise<Buffer> {
+  const pixels = Buffer.alloc(WIDTH * HEIGHT * 3);
+  let seed = 4242;
+  for (let i = 0; i < pixels.length; i += 3) {
+    seed = (Math.imul(seed, 1103515245) + 12345) & 0x7fffffff;
+    const colour = (seed >> 16) % 1000 < perMille ? DETAIL : BACKGROUND;
+    pixels[i] = colour[0];
+    pixels[i + 1] = colour[1];
+    pixels[i + 2] = colour[2];
+  }
+  return sharp(pixels, { raw: { width: WIDTH, height: HEIGHT, channels: 3 } })
+    .png()
+    .toBuffer();
+}
+
+describe('ScreenshotCapture', () => {
+  const capture = new ScreenshotCapture();
+
+  // These fixtures sit either side of the 0.3 complexity threshold (about
+  // 0.13 and 0.51 with per-pixel sampling). Averaging neighbouring pixels
+  // would wash the blue out and drop both to ~0.01, so the JPEG case also
+  // guards against the sampling changing from individual pixels to blocks.
+  test('should keep a mostly flat screenshot as PNG', async () => {
+    const optimized = await capture['optimizeImage'](await sparseDetailScreenshot(5));
+    expect(capture.detectImageFormat(optimized)).toBe('image/png');
+  });
+
+  test('should switch to JPEG once coloured detail crosses the threshold', async () => {
+    const optimized = await capture['optimizeImage'](await sparseDetailScreenshot(15));
+    expect(capture.detectImageFormat(optimized)).toBe('image/jpeg');
+  });
+});
\ No newline at end of file